@@ -1,28 +1,57 @@
 import ast  #python built-in module
 import json # need for the output format
 
-with open("sample.py", "r") as f:
-    code = f.read()   #reads its entire contents as a string.
+with open("sample.py", "rb") as f:
+    code = f.read()   #reads its entire contents as bytes (ast.parse handles the decoding)
 
 tree = ast.parse(code) #converting the source code(sample.py) into AST
 
-functions = [] # empty lists to store information
-classes = []
-imports = []
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case) # nodes that can contain statements
 
-for node in ast.walk(tree):  # for every node in the tree (ast.walk traverses the entire tree)
-    if isinstance(node, ast.FunctionDef): #Whether the current node represents a function definition.
-        functions.append({
+class _EntityCollector(ast.NodeVisitor): # visits only the node types we care about (dispatch by node class name)
+    def __init__(self):
+        self.functions = [] # empty lists to store information
+        self.classes = []
+        self.imports = []
+
+    def visit_FunctionDef(self, node): #called for a function definition.
+        self.functions.append({
             "name": node.name,
             "line": node.lineno
         })
-    elif isinstance(node, ast.ClassDef): #Whether the node represents a class definition.
-        classes.append({
+        # no generic_visit here -> definitions inside the body are skipped
+        self._collect_body_imports(node) # but imports inside the function still count
+
+    def _collect_body_imports(self, node): #looks only at statements (never expressions) to find nested imports
+        stack = list(reversed(node.body))
+        while stack:
+            stmt = stack.pop()
+            if isinstance(stmt, ast.Import):
+                self.imports.extend([n.name for n in stmt.names])
+            else: # step into nested blocks (if/for/try/with/match, inner defs and classes)
+                stack.extend(reversed([c for c in ast.iter_child_nodes(stmt) if isinstance(c, _BLOCK_NODES)]))
+
+    visit_AsyncFunctionDef = visit_FunctionDef # "async def" functions are recorded the same way
+
+    def visit_ClassDef(self, node): #called for a class definition.
+        self.classes.append({
             "name": node.name,
             "line": node.lineno
         })
-    elif isinstance(node, ast.Import): # This records which external modules the source code depends on.
-        imports.extend([n.name for n in node.names])
+        #only the class body is visited so methods are found (bases/decorators can't hold definitions)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def visit_Import(self, node): # This records which external modules the source code depends on.
+        self.imports.extend([n.name for n in node.names])
+
+
+collector = _EntityCollector()
+collector.visit(tree) # walks the tree but never goes inside function bodies
+
+functions = collector.functions
+classes = collector.classes
+imports = collector.imports
 
 
 output = {